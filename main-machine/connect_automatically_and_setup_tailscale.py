@@ -6,12 +6,32 @@ I also had to use a tunnel so that the various devices could communicate with ea
 
 """
 
+import ctypes
 import json
+import logging
+import os
 import subprocess
+import threading
 import time
 import requests
+import select
+import signal
 import socket
 import sys
+import pywintypes
+import win32event
+import win32file
+import win32service
+import win32serviceutil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from ctypes import wintypes
+from urllib.parse import urljoin, urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Fortschritt läuft über INFO, angezeigt werden standardmäßig nur Warnungen
+log = logging.getLogger(__name__)
+log.setLevel(logging.WARNING)
 
 # ============================================================
 # NETZWERK LOGIN FUNKTIONEN
@@ -21,151 +41,439 @@ TRIGGER_URL = "http://captive.apple.com/hotspot-detect.html"
 SESSION_URL = "https://hotspot.vodafone.de/api/v4/session"
 LOGIN_URL = "https://hotspot.vodafone.de/api/v4/login"
 
-def wait_for_ip():
+LOGIN_PARAMS = {
+    "loginProfile": "6",
+    "accessType": "termsOnly",
+    "action": "redirect",
+    "portal": "bayern"
+}
+
+DNS_TTL = 300
+_DNS_CACHE = {}
+
+class HostHeaderSSLAdapter(HTTPAdapter):
+    """HTTPAdapter, der SNI und Zertifikatsprüfung am Host-Header statt an der (IP-)URL festmacht"""
+    
+    def send(self, request, **kwargs):
+        pool_kw = self.poolmanager.connection_pool_kw
+        host = request.headers.get("Host")
+        if host:
+            pool_kw["server_hostname"] = host
+            pool_kw["assert_hostname"] = host
+        else:
+            pool_kw.pop("server_hostname", None)
+            pool_kw.pop("assert_hostname", None)
+        return super().send(request, **kwargs)
+
+# Eine Session für alle Anfragen, damit Session- und Login-Request
+# dieselbe TLS-Verbindung zu hotspot.vodafone.de nutzen
+SESSION = requests.Session()
+SESSION.headers["Connection"] = "keep-alive"
+SESSION.mount("https://", HostHeaderSSLAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+# Der HTTP-Trigger schlägt meistens absichtlich fehl, daher ohne Wiederholungen
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+AF_INET = 2
+# VOID (PVOID CallerContext, PMIB_UNICASTIPADDRESS_ROW Row, MIB_NOTIFICATION_TYPE NotificationType)
+IP_CHANGE_CALLBACK = ctypes.WINFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int)
+
+def resolved(host):
+    """Löst host auf und merkt sich das Ergebnis für DNS_TTL Sekunden"""
+    ip, expires = _DNS_CACHE.get(host, (None, 0))
+    if time.time() < expires:
+        return ip
+    
+    ip = socket.getaddrinfo(host, None, socket.AF_INET)[0][4][0]
+    _DNS_CACHE[host] = (ip, time.time() + DNS_TTL)
+    return ip
+
+def pinned_get(url, **kwargs):
+    """SESSION.get über die gecachte IP, der Hostname geht als Host-Header mit"""
+    parts = urlsplit(url)
+    host = parts.hostname
+    try:
+        ip = resolved(host)
+    except OSError as e:
+        # Wie ein DNS-Fehler innerhalb von requests behandeln
+        raise requests.exceptions.ConnectionError(f"DNS-Auflösung von {host} fehlgeschlagen: {e}") from e
+    netloc = ip if parts.port is None else f"{ip}:{parts.port}"
+    headers = dict(kwargs.pop("headers", None) or {}, Host=host)
+    
+    try:
+        return SESSION.get(parts._replace(netloc=netloc).geturl(), headers=headers, **kwargs)
+    except requests.exceptions.ConnectionError:
+        # Veraltete Adresse nicht weiterverwenden
+        _DNS_CACHE.pop(host, None)
+        raise
+
+def get_local_ip():
+    """Liest die lokale IPv4-Adresse der Default-Route aus (ohne DNS-Lookup)"""
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.setblocking(False)
+        # UDP-connect sendet kein Paket, es wird nur die Route ausgewählt
+        s.connect(("8.8.8.8", 80))
+        ip = s.getsockname()[0]
+    except OSError:
+        return None
+    finally:
+        s.close()
+    
+    # Loopback und APIPA (keine DHCP-Antwort) sind nicht das was wir wollen
+    if ip.startswith("127.") or ip.startswith("169.254.") or ip == "0.0.0.0":
+        return None
+    return ip
+
+def wait_for_ip(timeout=60):
     """Wartet, bis Windows eine IP-Adresse hat"""
-    print("Warte auf IP-Adresse...")
-    max_attempts = 30
-    attempt = 0
+    log.info("Warte auf IP-Adresse...")
     
-    while attempt < max_attempts:
-        try:
-            # Hole den Hostnamen
-            hostname = socket.gethostname()
-            # Versuche IP-Adresse zu bekommen
-            ip = socket.gethostbyname(hostname)
-            
-            # 127.0.0.1 ist Loopback, nicht das was wir wollen
-            if ip and ip != "127.0.0.1":
-                print(f"IP-Adresse gefunden: {ip}")
+    # Windows benachrichtigt uns, sobald sich eine Adresse ändert,
+    # statt dass wir alle paar Sekunden nachfragen
+    changed = threading.Event()
+    
+    @IP_CHANGE_CALLBACK
+    def on_change(context, row, notification_type):
+        changed.set()
+    
+    # Erst registrieren, dann prüfen: sonst geht eine Änderung dazwischen verloren
+    iphlpapi = ctypes.WinDLL("iphlpapi")
+    handle = wintypes.HANDLE()
+    registered = iphlpapi.NotifyUnicastIpAddressChange(
+        AF_INET, on_change, None, False, ctypes.byref(handle)
+    ) == 0
+    if not registered:
+        log.warning("Adress-Benachrichtigung nicht verfügbar, prüfe alle 2 Sekunden.")
+    
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            changed.clear()
+            ip = get_local_ip()
+            if ip:
+                log.info("IP-Adresse gefunden: %s", ip)
                 return True
-        except:
-            pass
-        
-        attempt += 1
-        time.sleep(2)
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            changed.wait(remaining if registered else min(2, remaining))
+    finally:
+        if registered:
+            iphlpapi.CancelMibChangeNotify2(handle)
     
-    print("Keine IP-Adresse nach 60 Sekunden gefunden.")
+    log.warning("Keine IP-Adresse nach %s Sekunden gefunden.", timeout)
     return False
 
+def tcp_reachable(host, port, timeout=1.0):
+    """Prüft mit einem nicht-blockierenden Socket, ob host:port eine TCP-Verbindung annimmt"""
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return False
+    
+    try:
+        s.setblocking(False)
+        s.connect_ex((host, port))
+        # Unter Windows landet ein fehlgeschlagener Verbindungsaufbau in der Fehler-Liste
+        _, writable, failed = select.select([], [s], [s], timeout)
+        if not writable or failed:
+            return False
+        return s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+    except OSError:
+        return False
+    finally:
+        s.close()
+
 def trigger_dns_and_login():
-    print("Starte Login-Prozess...")
+    log.info("Starte Login-Prozess...")
     
+    # Einmal über den Cache auflösen: connect_ex mit Hostname würde blockierend
+    # (ohne Timeout) auflösen, und requests hätte danach noch einmal nachgefragt
+    trigger_host = urlsplit(TRIGGER_URL).hostname
     try:
-        print("Sende Trigger-Anfrage (http)...")
-        requests.get(TRIGGER_URL, timeout=5, allow_redirects=True)
-    except Exception as e:
-        print(f"Trigger ausgelöst (Fehler erwartet): {e}")
+        reachable = tcp_reachable(resolved(trigger_host), 80)
+    except OSError as e:
+        log.info("DNS-Auflösung von %s fehlgeschlagen: %s", trigger_host, e)
+        reachable = False
+    
+    if reachable:
+        try:
+            log.info("Sende Trigger-Anfrage (http)...")
+            # Nur der erste Schritt über die gecachte IP; eine Weiterleitung zum
+            # Portal darf den Host-Header von captive.apple.com nicht mitnehmen
+            response = pinned_get(TRIGGER_URL, timeout=5, allow_redirects=False)
+            if response.is_redirect:
+                SESSION.get(urljoin(TRIGGER_URL, response.headers["Location"]),
+                            timeout=5, allow_redirects=True)
+        except Exception as e:
+            log.info("Trigger ausgelöst (Fehler erwartet): %s", e)
+    else:
+        log.info("%s nicht erreichbar, überspringe Trigger-Anfrage.", trigger_host)
     
     time.sleep(3)
     
     try:
-        print(f"Versuche Session von {SESSION_URL} zu holen...")
-        response = requests.get(SESSION_URL, timeout=10)
+        log.info("Versuche Session von %s zu holen...", SESSION_URL)
+        response = pinned_get(SESSION_URL, timeout=10)
         response.raise_for_status()
         
         data = response.json()
         session_id = data.get("session")
         
         if not session_id:
-            print("Keine Session-ID im JSON gefunden.")
+            log.warning("Keine Session-ID im JSON gefunden.")
             return False
             
-        print(f"Session ID: {session_id}")
+        log.info("Session ID: %s", session_id)
         
-        params = {
-            "loginProfile": "6",
-            "accessType": "termsOnly",
-            "sessionID": session_id,
-            "action": "redirect",
-            "portal": "bayern"
-        }
-        login_response = requests.get(LOGIN_URL, params=params, timeout=10)
+        params = dict(LOGIN_PARAMS, sessionID=session_id)
+        login_response = pinned_get(LOGIN_URL, params=params, timeout=10)
         
         if login_response.status_code == 200:
-            print("Login Request erfolgreich gesendet.")
+            log.info("Login Request erfolgreich gesendet.")
             return True
         
     except requests.exceptions.ConnectionError as e:
-        print(f"Verbindungsfehler (DNS?): {e}")
+        log.warning("Verbindungsfehler (DNS?): %s", e)
     except Exception as e:
-        print(f"Allgemeiner Fehler: {e}")
+        log.warning("Allgemeiner Fehler: %s", e)
         
     return False
 
 def check_internet():
     """Prüft ob Internet verfügbar ist"""
-    try:
-        requests.get("https://www.google.com", timeout=3)
-        return True
-    except:
-        return False
+    # TCP auf Port 443 von Cloudflare: kein Namens-Lookup, kein TLS-Handshake.
+    # Nicht Port 53, den lassen Captive Portals oft schon vor dem Login durch
+    return tcp_reachable("1.1.1.1", 443)
 
 # ============================================================
 # TAILSCALE AUTO-CONNECT (WINDOWS)
 # ============================================================
 
+TAILSCALE_PIPE = r"\\.\pipe\ProtectedPrefix\Administrators\Tailscale\tailscaled"
+# HTTP/1.0, damit tailscaled den Body ohne Chunked-Encoding schickt und danach schließt
+LOCALAPI_STATUS_REQUEST = (
+    b"GET /localapi/v0/status HTTP/1.0\r\n"
+    b"Host: local-tailscaled.sock\r\n"
+    b"\r\n"
+)
+ERROR_BROKEN_PIPE = 109
+LOCALAPI_TIMEOUT = 3.0
+
+TAILSCALE_SERVICE = "Tailscale"
+# Merkt sich die letzte erfolgreiche Verbindung, damit Neustarts nichts prüfen müssen
+STATE_FILE = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")),
+                          "tailscale-autoconnect", "state.json")
+STATE_TTL = 300
+
+def tailscale_service_running():
+    """Fragt den Windows-Dienst ab: True/False, None wenn der Dienst nicht abfragbar ist"""
+    try:
+        status = win32serviceutil.QueryServiceStatus(TAILSCALE_SERVICE)[1]
+    except pywintypes.error:
+        return None
+    return status == win32service.SERVICE_RUNNING
+
+def _state_fresh():
+    """Prüft ob die letzte erfolgreiche Verbindung jünger als STATE_TTL ist"""
+    try:
+        with open(STATE_FILE, encoding="utf-8") as f:
+            state = json.load(f)
+        return time.time() - state["connected_at"] < STATE_TTL
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+def _save_state():
+    """Speichert den Zeitpunkt der erfolgreichen Verbindung"""
+    try:
+        os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+        with open(STATE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"connected_at": time.time()}, f)
+    except OSError as e:
+        log.warning("Status-Datei konnte nicht geschrieben werden: %s", e)
+
+def _wait_pipe_io(handle, overlapped, deadline):
+    """Wartet auf eine überlappte Pipe-Operation, höchstens bis deadline"""
+    remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+    if win32event.WaitForSingleObject(overlapped.hEvent, remaining_ms) != win32event.WAIT_OBJECT_0:
+        win32file.CancelIo(handle)
+        try:
+            # Abbruch abwarten, bevor der Puffer wiederverwendet wird
+            win32file.GetOverlappedResult(handle, overlapped, True)
+        except pywintypes.error:
+            pass
+        raise TimeoutError("LocalAPI antwortet nicht")
+    return win32file.GetOverlappedResult(handle, overlapped, False)
+
+def localapi_status(timeout=LOCALAPI_TIMEOUT):
+    """Holt den Status direkt von tailscaled über die LocalAPI (Named Pipe)"""
+    deadline = time.monotonic() + timeout
+    # Überlappt öffnen, damit ein hängendes tailscaled uns nicht ewig blockiert
+    handle = win32file.CreateFile(
+        TAILSCALE_PIPE,
+        win32file.GENERIC_READ | win32file.GENERIC_WRITE,
+        0, None,
+        win32file.OPEN_EXISTING,
+        win32file.FILE_FLAG_OVERLAPPED, None
+    )
+    
+    chunks = []
+    try:
+        overlapped = pywintypes.OVERLAPPED()
+        overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        
+        win32file.WriteFile(handle, LOCALAPI_STATUS_REQUEST, overlapped)
+        _wait_pipe_io(handle, overlapped, deadline)
+        
+        buf = win32file.AllocateReadBuffer(65536)
+        while True:
+            try:
+                win32file.ReadFile(handle, buf, overlapped)
+                count = _wait_pipe_io(handle, overlapped, deadline)
+            except pywintypes.error as e:
+                # tailscaled schließt die Pipe nach der Antwort
+                if e.winerror == ERROR_BROKEN_PIPE:
+                    break
+                raise
+            if not count:
+                break
+            chunks.append(bytes(buf[:count]))
+    finally:
+        win32file.CloseHandle(handle)
+    
+    head, _, body = b"".join(chunks).partition(b"\r\n\r\n")
+    status_line = head.split(b"\r\n", 1)[0]
+    if status_line.split(b" ")[1:2] != [b"200"]:
+        raise RuntimeError(f"LocalAPI antwortet mit: {status_line.decode(errors='replace')}")
+    
+    return json.loads(body)
+
+def run_bounded(cmd, timeout):
+    """Startet cmd als eigene Prozessgruppe und beendet sie sicher, wenn timeout überschritten wird"""
+    proc = subprocess.Popen(cmd,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            text=True,
+                            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        # Erst freundlich (Ctrl+Break an die Gruppe), dann hart. Ohne eigene
+        # Konsole (pythonw, Aufgabenplanung) schlägt Ctrl+Break mit OSError fehl
+        try:
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+            proc.wait(2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        try:
+            stdout, stderr = proc.communicate(timeout=2)
+        except subprocess.TimeoutExpired:
+            # Ein Enkelprozess hält die Pipes noch offen, Ausgabe verwerfen
+            stdout, stderr = None, None
+        raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+    
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+def tailscale_connected(tailscale_path):
+    """Prüft ob Tailscale verbunden ist, notfalls über die CLI"""
+    try:
+        return localapi_status().get("BackendState") == "Running"
+    except (pywintypes.error, RuntimeError, ValueError, TimeoutError) as e:
+        log.warning("LocalAPI nicht erreichbar (%s), nutze tailscale.exe...", e)
+    
+    result = run_bounded([tailscale_path, 'status', '--json'], timeout=5)
+    if result.returncode != 0:
+        return False
+    return json.loads(result.stdout).get("BackendState") == "Running"
+
 def ensure_tailscale_connected():
     """Stellt sicher, dass Tailscale verbunden ist (Windows Version)"""
-    print("\n" + "="*60)
-    print("PRÜFE TAILSCALE VERBINDUNG")
-    print("="*60)
+    log.info("Prüfe Tailscale Verbindung...")
     
     # Pfad zu Tailscale unter Windows
     tailscale_path = r"C:\Program Files\Tailscale\tailscale.exe"
     
-    try:
-        # Prüfe Tailscale Status
-        result = subprocess.run([tailscale_path, 'status'], 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=5)
-        
-        if result.returncode == 0 and result.stdout:
-            print("✓ Tailscale ist bereits verbunden")
-            print("="*60)
-            return True
-    except FileNotFoundError:
-        print(f"✗ Tailscale nicht gefunden unter: {tailscale_path}")
-        print("Bitte installiere Tailscale von: https://tailscale.com/download/windows")
-        print("="*60)
-        return False
-    except Exception as e:
-        print(f"Status-Prüfung fehlgeschlagen: {e}")
+    # Schneller Weg: Dienst läuft und wir waren vor kurzem schon verbunden
+    service_running = tailscale_service_running()
+    if service_running and _state_fresh():
+        log.info("✓ Tailscale läuft und war vor kurzem verbunden")
+        return True
+    
+    # Läuft der Dienst nicht, kann der Status nur "nicht verbunden" sein
+    if service_running is False:
+        log.info("Tailscale-Dienst läuft nicht, überspringe Status-Prüfung.")
+    else:
+        try:
+            # Prüfe Tailscale Status
+            if tailscale_connected(tailscale_path):
+                log.info("✓ Tailscale ist bereits verbunden")
+                _save_state()
+                return True
+        except FileNotFoundError:
+            log.warning("✗ Tailscale nicht gefunden unter: %s", tailscale_path)
+            log.warning("Bitte installiere Tailscale von: https://tailscale.com/download/windows")
+            return False
+        except Exception as e:
+            log.warning("Status-Prüfung fehlgeschlagen: %s", e)
     
     # Wenn nicht verbunden, versuche zu verbinden
-    print("Starte Tailscale Verbindung...")
+    log.info("Starte Tailscale Verbindung...")
     try:
-        subprocess.run([tailscale_path, 'up'], 
-                      timeout=30,
-                      check=False)
-        
-        time.sleep(5)
-        
-        # Prüfe erneut
-        result = subprocess.run([tailscale_path, 'status'], 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=5)
+        # "tailscale up" kehrt erst zurück, wenn die Verbindung steht oder fehlschlägt,
+        # der Exit-Code reicht also als Ergebnis
+        result = run_bounded([tailscale_path, 'up'], timeout=30)
         
         if result.returncode == 0:
-            print("✓ Tailscale erfolgreich verbunden")
-            print("="*60)
+            log.info("✓ Tailscale erfolgreich verbunden")
+            _save_state()
             return True
         else:
-            print("✗ Tailscale Verbindung fehlgeschlagen")
-            print("="*60)
+            log.warning("✗ Tailscale Verbindung fehlgeschlagen")
+            if result.stderr:
+                log.warning("%s", result.stderr.strip())
             return False
-            
+    
+    except subprocess.TimeoutExpired as e:
+        # Enthält z.B. den Login-Link, falls Tailscale eine Anmeldung braucht
+        log.warning("✗ Tailscale antwortet nicht nach %s Sekunden", e.timeout)
+        if e.stderr:
+            log.warning("%s", e.stderr.strip())
+        return False
     except Exception as e:
-        print(f"✗ Fehler beim Verbinden: {e}")
-        print("="*60)
+        log.warning("✗ Fehler beim Verbinden: %s", e)
         return False
 
 # ============================================================
 # HAUPTPROGRAMM
 # ============================================================
 
+def handle_captive_portal():
+    """Prüft den Internet-Zugang und meldet sich bei Bedarf im Bayern WLAN an"""
+    log.info("Prüfe Internet-Zugang...")
+    if not check_internet():
+        log.info("Kein Internet gefunden. Starte Bayern WLAN Login...")
+        if trigger_dns_and_login():
+            # Warte kurz und prüfe erneut
+            time.sleep(5)
+            if check_internet():
+                log.info("✓ Internet-Zugang erfolgreich!")
+                return True
+            else:
+                log.warning("✗ Login möglicherweise fehlgeschlagen.")
+        return False
+    
+    log.info("✓ Internet bereits verfügbar!")
+    return True
+
 def main():
+    logging.basicConfig(format="%(message)s")
+    
     print("="*60)
     print("BAYERN WLAN + TAILSCALE AUTO-CONNECT (WINDOWS)")
     print("="*60)
@@ -175,22 +483,44 @@ def main():
         print("Fehler: Keine IP-Adresse erhalten.")
         return
     
-    # Versuche Internet-Zugang
-    print("\nPrüfe Internet-Zugang...")
-    if not check_internet():
-        print("Kein Internet gefunden. Starte Bayern WLAN Login...")
-        if trigger_dns_and_login():
-            # Warte kurz und prüfe erneut
-            time.sleep(5)
-            if check_internet():
-                print("✓ Internet-Zugang erfolgreich!")
-            else:
-                print("✗ Login möglicherweise fehlgeschlagen.")
-    else:
-        print("✓ Internet bereits verfügbar!")
+    # Login und Tailscale gleichzeitig starten: hinter einem schon
+    # freigeschalteten Portal spart das die Wartezeit auf den Login
+    login, tailscale = "Bayern WLAN Login", "Tailscale"
+    results = {}
+    retried = False
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pending = {
+            executor.submit(handle_captive_portal): login,
+            executor.submit(ensure_tailscale_connected): tailscale,
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    ok = False
+                    log.warning("%s: %s", name, e)
+                
+                if name == login:
+                    print(f"✓ {login} erfolgreich" if ok else f"✗ {login} fehlgeschlagen")
+                elif ok and not results.get(tailscale):
+                    print(f"✓ {tailscale} erfolgreich")
+                results[name] = results.get(name) or ok
+            
+            if results.get(tailscale):
+                # Ein zweiter Versuch kann noch laufen, sein Ergebnis zählt nicht mehr
+                pending = {f: n for f, n in pending.items() if n != tailscale}
+            elif results.get(login) and not retried:
+                # Vor dem Login kommt Tailscale nicht zum Koordinationsserver durch.
+                # Nicht auf das Timeout des ersten Versuchs warten, sofort neu starten
+                retried = True
+                log.info("Login erfolgreich, starte Tailscale erneut...")
+                pending[executor.submit(ensure_tailscale_connected)] = tailscale
     
-    # Tailscale verbinden
-    ensure_tailscale_connected()
+    if not results.get(tailscale):
+        print(f"✗ {tailscale} fehlgeschlagen")
     
     print("\n" + "="*60)
     print("FERTIG!")
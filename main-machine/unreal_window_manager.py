@@ -7,14 +7,118 @@ in portrait mode (480x800) when they appear after clicking Play.
 Includes HTTP server for dynamic window reordering from Unreal Engine blueprints.
 """
 
+import ctypes
+import logging
 import win32gui
 import win32con
 import win32api
+import win32process
+import psutil
+import re
 import time
 import threading
-from typing import List, Dict, Optional
+from ctypes import wintypes
+from typing import List, Dict, Optional, Set, Tuple
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from waitress import serve
+
+
+# Per-window traces go to DEBUG; console writes are slow on Windows and
+# would otherwise happen several times per /reorder request
+log = logging.getLogger(__name__)
+log.setLevel(logging.WARNING)
+
+# Typical titles: "GameName Preview [NetMode: Server]"
+#                 "GameName Preview [NetMode: Client 1]"
+_NETMODE_RE = re.compile(r"NetMode:\s*(Server|Client [1-3])")
+
+# Win32 constants and style masks, combined once at import instead of on every call
+_WS_MAXMIN = win32con.WS_MAXIMIZE | win32con.WS_MINIMIZE
+_WS_CLEAR = (                          # Removed when making a window borderless
+    win32con.WS_CAPTION |              # Title bar
+    win32con.WS_THICKFRAME |           # Resize border
+    win32con.WS_SYSMENU |              # System menu
+    win32con.WS_BORDER |               # Border
+    win32con.WS_DLGFRAME |             # Dialog frame
+    0x00800000 |                       # WS_SIZEBOX
+    _WS_MAXMIN
+)
+_WS_ADD = win32con.WS_POPUP | win32con.WS_VISIBLE
+_EX_CLEAR = (
+    win32con.WS_EX_DLGMODALFRAME |
+    win32con.WS_EX_CLIENTEDGE |
+    win32con.WS_EX_STATICEDGE |
+    win32con.WS_EX_WINDOWEDGE |
+    0x00000200                         # WS_EX_OVERLAPPEDWINDOW
+)
+_GWL_STYLE = win32con.GWL_STYLE
+_GWL_EXSTYLE = win32con.GWL_EXSTYLE
+_HWND_TOP = win32con.HWND_TOP
+# Re-apply the frame after a style change without moving the window
+_SWP_FRAME = win32con.SWP_NOMOVE | win32con.SWP_NOSIZE | win32con.SWP_NOZORDER | win32con.SWP_FRAMECHANGED
+_SWP_PLACE = win32con.SWP_SHOWWINDOW | win32con.SWP_FRAMECHANGED
+# Plain move/resize of an already styled window
+# (synchronous on purpose: the rect is verified right after the call)
+_SWP_MOVE = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+# DeferWindowPos doesn't accept SWP_ASYNCWINDOWPOS either
+_SWP_DEFER = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+
+# Processes that own the multiplayer preview windows
+UNREAL_PROCESS_NAMES = {"UnrealEditor.exe", "UE4Editor.exe"}
+
+# WinEvent constants (winuser.h)
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+QS_ALLINPUT = 0x04FF
+
+# Deferred window positioning and WinEvent hooks aren't wrapped by pywin32
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_user32.BeginDeferWindowPos.argtypes = [ctypes.c_int]
+_user32.BeginDeferWindowPos.restype = wintypes.HANDLE
+_user32.DeferWindowPos.argtypes = [
+    wintypes.HANDLE, wintypes.HWND, wintypes.HWND,
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT
+]
+_user32.DeferWindowPos.restype = wintypes.HANDLE
+_user32.EndDeferWindowPos.argtypes = [wintypes.HANDLE]
+_user32.EndDeferWindowPos.restype = wintypes.BOOL
+
+_WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+_user32.SetWinEventHook.argtypes = [
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, _WINEVENTPROC,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+]
+_user32.SetWinEventHook.restype = wintypes.HANDLE
+_user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+_user32.UnhookWinEvent.restype = wintypes.BOOL
+_user32.MsgWaitForMultipleObjects.argtypes = [
+    wintypes.DWORD, ctypes.c_void_p, wintypes.BOOL, wintypes.DWORD, wintypes.DWORD
+]
+_user32.MsgWaitForMultipleObjects.restype = wintypes.DWORD
+
+
+def _preview_key(title: str) -> Optional[str]:
+    """Return the window key ('Server', 'Client 1', ...) for a preview window title, or None."""
+    # Cheap gate before the regex, most windows are not previews
+    if "Preview" not in title:
+        return None
+    
+    match = _NETMODE_RE.search(title)
+    return match.group(1) if match else None
+
+
+class _AllWindowsFound(Exception):
+    """Raised from the EnumWindows callback to stop enumeration early."""
 
 
 class UnrealWindowManager:
@@ -22,13 +126,20 @@ class UnrealWindowManager:
     
     def __init__(self, borderless: bool = True, hide_titlebar: bool = True):
         """Initialize the window manager."""
-        self.found_windows = {}
+        self.found_windows = {}  # Filled by the WinEvent hook in wait_and_position
+        self._ready = threading.Event()  # Set once all 4 preview windows are known
+        self._ue_pids: Set[int] = set()  # Unreal Editor processes, empty = don't filter
+        # window_handles and current_order are only ever replaced, never mutated
+        # in place, so get_status can read them without taking the lock
         self.window_handles = {}  # Maps window index to handle
         self.current_order = [4, 2, 3, 1]  # Custom order: Client3, Client1, Client2, Server
         self.lock = threading.Lock()  # Thread safety for window operations
         self.borderless = borderless  # Remove title bars and borders
         self.hide_titlebar = hide_titlebar  # Hide title bar content by clipping
         self.titlebar_height = 32  # Approximate height of Unreal's title bar
+        self._styled: Dict[int, Tuple[int, int]] = {}  # Styled handles -> size the region was cut for
+        self._last_rect: Dict[int, Tuple[int, int, int, int]] = {}  # Last verified (x, y, w, h) per handle
+        self._last_apply_ok = False  # Whether the last full layout placed all 4 windows
         
         # Positions for 4 HAMTYSAN 7" displays (800x480) in portrait mode (480x800)
         # Arranged horizontally: [Display 0][Display 1][Display 2][Display 3]
@@ -43,42 +154,189 @@ class UnrealWindowManager:
         # Window mapping: index -> window key
         self.window_keys = ['Server', 'Client 1', 'Client 2', 'Client 3']
     
+    def _find_unreal_pids(self) -> Set[int]:
+        """Return the PIDs of all running Unreal Editor processes."""
+        return {
+            proc.info['pid']
+            for proc in psutil.process_iter(['name', 'pid'])
+            if proc.info['name'] in UNREAL_PROCESS_NAMES
+        }
+    
     def find_unreal_windows(self) -> Dict[str, int]:
         """
         Find all Unreal Engine preview windows.
         
+        Only windows owned by an Unreal Editor process are inspected, so
+        previews run as separate processes are found too. The editor PIDs
+        are cached and looked up again whenever fewer than 4 previews are
+        found (e.g. after a client process was started or the editor was
+        restarted).
+        
         Returns:
             Dictionary mapping window type (e.g., 'Server', 'Client 1') to window handle
         """
+        if not self._ue_pids:
+            self._ue_pids = self._find_unreal_pids()
+        
+        windows = self._enumerate_previews()
+        
+        if len(windows) < len(self.window_keys):
+            pids = self._find_unreal_pids()
+            if pids != self._ue_pids:
+                self._ue_pids = pids
+                windows = self._enumerate_previews()
+        
+        return windows
+    
+    def _enumerate_previews(self) -> Dict[str, int]:
+        """Walk the top-level windows of the cached Unreal Editor processes and collect the previews."""
         windows = {}
         
         def enum_callback(hwnd, results):
-            if win32gui.IsWindowVisible(hwnd):
-                title = win32gui.GetWindowText(hwnd)
+            if not win32gui.IsWindowVisible(hwnd):
+                return True
+            
+            # One cheap syscall filters out nearly every window before the title fetch
+            if self._ue_pids:
+                _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                if pid not in self._ue_pids:
+                    return True
+            
+            key = _preview_key(win32gui.GetWindowText(hwnd))
+            if key:
+                results[key] = hwnd
                 
-                # Look for Unreal preview windows
-                # Typical formats: "GameName Preview [NetMode: Server]"
-                #                  "GameName Preview [NetMode: Client 1]"
-                if "Preview" in title and "NetMode:" in title:
-                    # Extract the NetMode part
-                    if "Server" in title:
-                        results['Server'] = hwnd
-                    elif "Client 1" in title:
-                        results['Client 1'] = hwnd
-                    elif "Client 2" in title:
-                        results['Client 2'] = hwnd
-                    elif "Client 3" in title:
-                        results['Client 3'] = hwnd
+                # Stop enumerating once all 4 previews are known
+                if len(results) == len(self.window_keys):
+                    raise _AllWindowsFound
             
             return True
         
-        win32gui.EnumWindows(enum_callback, windows)
+        try:
+            win32gui.EnumWindows(enum_callback, windows)
+        except _AllWindowsFound:
+            pass
         return windows
     
+    def _wait_for_position(self, hwnd: int, x: int, y: int, timeout: float = 0.1) -> Tuple[bool, Tuple[int, int, int, int]]:
+        """
+        Poll the window rect until it is at (x, y) or the timeout runs out.
+        
+        Returns as soon as the window has arrived instead of sleeping a fixed
+        time; a window that never gets there costs at most timeout seconds.
+        
+        Returns:
+            (arrived, last window rect)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            rect = win32gui.GetWindowRect(hwnd)
+            # Allow some tolerance (within 10 pixels)
+            if abs(rect[0] - x) <= 10 and abs(rect[1] - y) <= 10:
+                return True, rect
+            if time.monotonic() >= deadline:
+                return False, rect
+            time.sleep(0.01)
+    
+    def _still_at(self, hwnd: int, x: int, y: int, width: int, height: int) -> bool:
+        """
+        Check whether a window we already placed at this rect is still there.
+        
+        Costs one GetWindowRect instead of the style and SetWindowPos calls,
+        but still notices windows displaced e.g. by a resolution change.
+        """
+        if self._last_rect.get(hwnd) != (x, y, width, height):
+            return False
+        
+        try:
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+        except Exception:
+            self._last_rect.pop(hwnd, None)
+            return False
+        
+        # Same tolerance as the position check
+        if (abs(left - x) <= 10 and abs(top - y) <= 10 and
+                abs((right - left) - width) <= 10 and abs((bottom - top) - height) <= 10):
+            return True
+        
+        self._last_rect.pop(hwnd, None)
+        return False
+    
+    def _clip_titlebar(self, hwnd: int, width: int, height: int):
+        """Crop the top titlebar_height pixels of the window out of view via a window region."""
+        try:
+            # Create a rectangular region that excludes the top titlebar_height pixels
+            # This effectively "crops" the title bar out of view
+            region = win32api.CreateRectRgn(
+                0, self.titlebar_height,  # Start below title bar
+                width, height  # Full width and remaining height
+            )
+            
+            # Apply the region to the window
+            win32gui.SetWindowRgn(hwnd, region, True)
+        except Exception as e:
+            log.warning("Could not apply window region: %s", e)
+    
+    def _apply_style(self, hwnd: int, x: int, y: int, width: int, height: int):
+        """Strip borders from a window, then position and resize it."""
+        # Make sure window is visible and not minimized
+        if win32gui.IsIconic(hwnd):
+            win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+        
+        # Ensure window is shown (ShowWindow/SetWindowPos on another thread's
+        # window only return once that thread has handled them, no waits needed)
+        win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
+        
+        # Get current window style
+        style = win32gui.GetWindowLong(hwnd, _GWL_STYLE)
+        
+        if self.borderless:
+            # Remove ALL border-related styles and make it a visible popup
+            style = (style & ~_WS_CLEAR) | _WS_ADD
+        else:
+            # Only remove maximize/minimize if present
+            style &= ~_WS_MAXMIN
+        
+        win32gui.SetWindowLong(hwnd, _GWL_STYLE, style)
+        
+        # Remove extended window borders
+        if self.borderless:
+            ex_style = win32gui.GetWindowLong(hwnd, _GWL_EXSTYLE)
+            win32gui.SetWindowLong(hwnd, _GWL_EXSTYLE, ex_style & ~_EX_CLEAR)
+        
+        # Force frame to update with new style
+        if self.borderless:
+            win32gui.SetWindowPos(hwnd, _HWND_TOP, 0, 0, 0, 0, _SWP_FRAME)
+        
+        # Now set window position and size
+        win32gui.SetWindowPos(
+            hwnd,
+            win32con.HWND_TOPMOST,
+            x, y, width, height,
+            _SWP_PLACE
+        )
+        
+        # Remove topmost flag so windows can be normal
+        win32gui.SetWindowPos(
+            hwnd,
+            win32con.HWND_NOTOPMOST,
+            x, y, width, height,
+            win32con.SWP_SHOWWINDOW
+        )
+        
+        # If we still have a title bar, clip it out using window region
+        if self.hide_titlebar and self.borderless:
+            rect = win32gui.GetWindowRect(hwnd)
+            self._clip_titlebar(hwnd, rect[2] - rect[0], rect[3] - rect[1])
+    
     def position_window(self, hwnd: int, x: int, y: int, width: int, height: int, retries: int = 3) -> bool:
         """
         Position and resize a window with retry logic.
         
+        The border-stripping style pass only runs the first time a window is
+        positioned; after that a single SetWindowPos moves it. A window that
+        is already verified at the requested rect is left alone.
+        
         Args:
             hwnd: Window handle
             x, y: Position coordinates
@@ -88,122 +346,150 @@ class UnrealWindowManager:
         Returns:
             True if successful, False otherwise
         """
+        if self._still_at(hwnd, x, y, width, height):
+            return True
+        
         for attempt in range(retries):
             try:
-                # Make sure window is visible and not minimized
-                if win32gui.IsIconic(hwnd):
-                    win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                    time.sleep(0.1)
-                
-                # Ensure window is shown
-                win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
-                time.sleep(0.05)
-                
-                # Get current window style
-                style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-                
-                # Remove maximize/minimize if present
-                style &= ~win32con.WS_MAXIMIZE
-                style &= ~win32con.WS_MINIMIZE
-                
-                # Make borderless if requested
-                if self.borderless:
-                    # Remove ALL border-related styles more aggressively
-                    style &= ~win32con.WS_CAPTION          # Remove title bar
-                    style &= ~win32con.WS_THICKFRAME       # Remove resize border
-                    style &= ~win32con.WS_SYSMENU          # Remove system menu
-                    style &= ~win32con.WS_BORDER           # Remove border
-                    style &= ~win32con.WS_DLGFRAME         # Remove dialog frame
-                    style &= ~(0x00800000)                 # WS_SIZEBOX
-                    style |= win32con.WS_POPUP             # Make it popup style
-                    style |= win32con.WS_VISIBLE           # Ensure visible
-                
-                win32gui.SetWindowLong(hwnd, win32con.GWL_STYLE, style)
-                
-                # Remove extended window borders
-                if self.borderless:
-                    ex_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
-                    ex_style &= ~win32con.WS_EX_DLGMODALFRAME
-                    ex_style &= ~win32con.WS_EX_CLIENTEDGE
-                    ex_style &= ~win32con.WS_EX_STATICEDGE
-                    ex_style &= ~win32con.WS_EX_WINDOWEDGE
-                    ex_style &= ~(0x00000200)              # WS_EX_OVERLAPPEDWINDOW
-                    win32gui.SetWindowLong(hwnd, win32con.GWL_EXSTYLE, ex_style)
-                
-                # Force frame to update with new style
-                if self.borderless:
+                if hwnd in self._styled:
                     win32gui.SetWindowPos(
                         hwnd,
-                        win32con.HWND_TOP,
-                        0, 0, 0, 0,
-                        win32con.SWP_NOMOVE | win32con.SWP_NOSIZE | 
-                        win32con.SWP_NOZORDER | win32con.SWP_FRAMECHANGED
+                        _HWND_TOP,
+                        x, y, width, height,
+                        _SWP_MOVE
                     )
-                    time.sleep(0.05)
-                
-                # Now set window position and size
-                flags = win32con.SWP_SHOWWINDOW | win32con.SWP_FRAMECHANGED
-                
-                result = win32gui.SetWindowPos(
-                    hwnd,
-                    win32con.HWND_TOPMOST,
-                    x, y, width, height,
-                    flags
-                )
-                
-                # Remove topmost flag so windows can be normal
-                win32gui.SetWindowPos(
-                    hwnd,
-                    win32con.HWND_NOTOPMOST,
-                    x, y, width, height,
-                    win32con.SWP_SHOWWINDOW
-                )
-                
-                # If we still have a title bar, clip it out using window region
-                if self.hide_titlebar and self.borderless:
-                    try:
-                        # Get actual window rect
-                        rect = win32gui.GetWindowRect(hwnd)
-                        window_width = rect[2] - rect[0]
-                        window_height = rect[3] - rect[1]
-                        
-                        # Create a rectangular region that excludes the top titlebar_height pixels
-                        # This effectively "crops" the title bar out of view
-                        region = win32api.CreateRectRgn(
-                            0, self.titlebar_height,  # Start below title bar
-                            window_width, window_height  # Full width and remaining height
-                        )
-                        
-                        # Apply the region to the window
-                        win32gui.SetWindowRgn(hwnd, region, True)
-                        time.sleep(0.05)
-                    except Exception as e:
-                        print(f"  ⚠ Could not apply window region: {e}")
+                    
+                    # The title bar region only needs recutting if the size changed
+                    if self.hide_titlebar and self.borderless and self._styled[hwnd] != (width, height):
+                        self._clip_titlebar(hwnd, width, height)
+                else:
+                    self._apply_style(hwnd, x, y, width, height)
                 
-                # Small delay to let the window settle
-                time.sleep(0.1)
+                self._styled[hwnd] = (width, height)
                 
                 # Verify the position was set correctly
-                rect = win32gui.GetWindowRect(hwnd)
+                arrived, rect = self._wait_for_position(hwnd, x, y)
                 actual_x, actual_y = rect[0], rect[1]
                 
-                # Allow some tolerance (within 10 pixels)
-                if abs(actual_x - x) <= 10 and abs(actual_y - y) <= 10:
+                if arrived:
+                    self._last_rect[hwnd] = (x, y, width, height)
                     return True
-                elif attempt < retries - 1:
-                    print(f"  ⚠ Position mismatch (expected {x},{y}, got {actual_x},{actual_y}), retrying...")
+                
+                # The window may have reset its style, redo the full pass
+                self._styled.pop(hwnd, None)
+                self._last_rect.pop(hwnd, None)
+                if attempt < retries - 1:
+                    log.debug("Position mismatch (expected %d,%d, got %d,%d), retrying...", x, y, actual_x, actual_y)
                     time.sleep(0.2)
                 
             except Exception as e:
+                self._styled.pop(hwnd, None)
+                self._last_rect.pop(hwnd, None)
                 if attempt < retries - 1:
-                    print(f"  ⚠ Attempt {attempt + 1} failed: {e}, retrying...")
+                    log.debug("Attempt %d failed: %s, retrying...", attempt + 1, e)
                     time.sleep(0.2)
                 else:
-                    print(f"  ✗ Error positioning window after {retries} attempts: {e}")
+                    log.warning("Error positioning window after %d attempts: %s", retries, e)
                     return False
         
         return False
     
+    def _plan(self, order: List[int]) -> List[Tuple[int, int, int, int, int, str]]:
+        """
+        Resolve an order into flat positioning targets.
+        
+        Args:
+            order: Window index (1-4) for each display position
+        
+        Returns:
+            List of (hwnd, x, y, width, height, window_key) for every known window
+        """
+        return [
+            (self.window_handles[w], *self.positions[i], self.window_keys[w - 1])
+            for i, w in enumerate(order)
+            if w in self.window_handles
+        ]
+    
+    def _defer_moves(self, moves: List[Tuple[int, int, int, int, int, str]]) -> bool:
+        """
+        Move several windows in one BeginDeferWindowPos/EndDeferWindowPos transaction.
+        
+        Args:
+            moves: Entries from _plan
+        
+        Returns:
+            True if the whole batch was committed, False otherwise
+        """
+        hdwp = _user32.BeginDeferWindowPos(len(moves))
+        if not hdwp:
+            return False
+        
+        for hwnd, x, y, width, height, _ in moves:
+            hdwp = _user32.DeferWindowPos(
+                hdwp, hwnd, _HWND_TOP,
+                x, y, width, height,
+                _SWP_DEFER
+            )
+            # On failure DeferWindowPos already freed the batch
+            if not hdwp:
+                return False
+        
+        return bool(_user32.EndDeferWindowPos(hdwp))
+    
+    def _apply_moves(self, moves: List[Tuple[int, int, int, int, int, str]]) -> Dict[int, bool]:
+        """
+        Position several windows, batching the moves of already styled windows.
+        
+        Windows that still need the style pass go through position_window one
+        by one first; all others are moved together in a single deferred batch.
+        Anything the batch did not place falls back to position_window.
+        
+        Args:
+            moves: Entries from _plan
+        
+        Returns:
+            Dictionary mapping window handle to success
+        """
+        results = {}
+        batch = []
+        
+        # First pass: style changes, one window at a time
+        for move in moves:
+            hwnd = move[0]
+            if self._still_at(*move[:5]):
+                results[hwnd] = True  # Already there
+            elif hwnd in self._styled:
+                batch.append(move)
+            else:
+                results[hwnd] = self.position_window(*move[:5])
+        
+        if not batch:
+            return results
+        
+        # Second pass: all plain moves committed together
+        if self._defer_moves(batch):
+            for hwnd, x, y, width, height, _ in batch:
+                try:
+                    if self.hide_titlebar and self.borderless and self._styled[hwnd] != (width, height):
+                        self._clip_titlebar(hwnd, width, height)
+                        self._styled[hwnd] = (width, height)
+                    
+                    results[hwnd], _ = self._wait_for_position(hwnd, x, y)
+                except Exception:
+                    results[hwnd] = False
+                
+                if results[hwnd]:
+                    self._last_rect[hwnd] = (x, y, width, height)
+                else:
+                    self._last_rect.pop(hwnd, None)
+        
+        # Single-window retry path for whatever the batch missed
+        for move in batch:
+            if not results.get(move[0]):
+                results[move[0]] = self.position_window(*move[:5])
+        
+        return results
+    
     def position_all_windows(self, windows: Dict[str, int]) -> int:
         """
         Position all found windows according to current order configuration.
@@ -215,47 +501,82 @@ class UnrealWindowManager:
             Number of successfully positioned windows
         """
         with self.lock:
-            # Store window handles for later reordering
-            self.window_handles = {}
+            # Store window handles for later reordering (built first, then swapped in)
+            window_handles = {}
             for i, window_key in enumerate(self.window_keys):
                 if window_key in windows:
-                    self.window_handles[i + 1] = windows[window_key]  # 1-indexed
+                    window_handles[i + 1] = windows[window_key]  # 1-indexed
+            self.window_handles = window_handles
             
-            success_count = 0
+            # HWND values get reused across PIE sessions, so cache entries for
+            # handles that are gone would make a new window look already styled
+            live = set(window_handles.values())
+            for cache in (self._styled, self._last_rect):
+                for hwnd in [h for h in cache if h not in live]:
+                    del cache[hwnd]
             
-            # Apply current order to positions with delays between each window
-            for pos_idx, window_idx in enumerate(self.current_order):
-                if window_idx in self.window_handles:
-                    hwnd = self.window_handles[window_idx]
-                    x, y, width, height = self.positions[pos_idx]
-                    window_key = self.window_keys[window_idx - 1]
-                    
+            plan = self._plan(self.current_order)
+            labels = {}
+            
+            for hwnd, x, y, width, height, window_key in plan:
+                # Only fetch the title when the trace is actually emitted
+                if log.isEnabledFor(logging.DEBUG):
                     try:
                         title = win32gui.GetWindowText(hwnd)
                     except:
                         title = "Unknown"
                     
-                    print(f"Position {pos_idx} ← Window {window_idx} ({window_key}): {title}")
-                    print(f"  → Target: ({x}, {y}), Size: {width}x{height}")
-                    
-                    if self.position_window(hwnd, x, y, width, height):
-                        success_count += 1
-                        print(f"  ✓ Successfully positioned")
-                    else:
-                        print(f"  ✗ Failed to position")
-                    
-                    # Small delay between positioning each window
-                    time.sleep(0.15)
+                    log.debug("%s: %s → Target: (%d, %d), Size: %dx%d", window_key, title, x, y, width, height)
+                labels[hwnd] = window_key
+            
+            self._last_apply_ok = False
+            results = self._apply_moves(plan)
+            success_count = sum(results.values())
+            self._last_apply_ok = success_count == 4
+            
+            for hwnd, ok in results.items():
+                if ok:
+                    log.debug("%s successfully positioned", labels[hwnd])
+                else:
+                    log.warning("%s failed to position", labels[hwnd])
             
             return success_count
     
-    def wait_and_position(self, timeout: int = 60, check_interval: float = 0.5):
+    def _on_win_event(self, hook, event, hwnd, id_object, id_child, thread_id, event_time):
+        """WinEvent callback: track preview windows as they are created, shown, renamed or destroyed."""
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF or not hwnd:
+            return
+        
+        try:
+            if event == EVENT_OBJECT_DESTROY:
+                for key, known in list(self.found_windows.items()):
+                    if known == hwnd:
+                        del self.found_windows[key]
+                        self._ready.clear()
+                self._styled.pop(hwnd, None)
+                self._last_rect.pop(hwnd, None)
+                return
+            
+            if not win32gui.IsWindowVisible(hwnd):
+                return
+            
+            key = _preview_key(win32gui.GetWindowText(hwnd))
+            if key:
+                self.found_windows[key] = hwnd
+                if len(self.found_windows) >= 4:
+                    self._ready.set()
+        except Exception:
+            pass  # Window vanished mid-callback; exceptions must not escape into ctypes
+    
+    def wait_and_position(self, timeout: int = 60):
         """
         Wait for Unreal windows to appear and position them automatically.
         
+        Instead of polling, a WinEvent hook reports new and renamed windows,
+        and the thread sleeps in MsgWaitForMultipleObjects until one arrives.
+        
         Args:
             timeout: Maximum time to wait in seconds (default: 60)
-            check_interval: How often to check for windows in seconds (default: 0.5)
         """
         print("Unreal Engine Window Manager")
         print("=" * 60)
@@ -263,54 +584,81 @@ class UnrealWindowManager:
         print("(Start your multiplayer preview in Unreal Editor)")
         print()
         
-        start_time = time.time()
+        self.found_windows = {}
+        self._ready.clear()
+        
+        # Install the hooks before scanning, so a preview that appears while
+        # the scan runs is still reported (events queue up until we pump)
+        # Keep the ctypes callback alive for as long as the hooks exist
+        proc = _WINEVENTPROC(self._on_win_event)
+        flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        hooks = [
+            _user32.SetWinEventHook(EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, None, proc, 0, 0, flags),
+            _user32.SetWinEventHook(EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE, None, proc, 0, 0, flags),
+        ]
+        
+        deadline = time.time() + timeout
         last_count = 0
         
-        while time.time() - start_time < timeout:
-            # Find windows
-            windows = self.find_unreal_windows()
-            current_count = len(windows)
-            
-            # Show progress when new windows are detected
-            if current_count != last_count:
-                print(f"Found {current_count}/4 windows...")
-                for window_type in windows.keys():
-                    title = win32gui.GetWindowText(windows[window_type])
-                    print(f"  - {window_type}: {title}")
-                last_count = current_count
+        try:
+            # Pick up previews that are already open, the hook only sees new events
+            self.found_windows.update(self.find_unreal_windows())
+            if len(self.found_windows) >= 4:
+                self._ready.set()
             
-            # When all 4 windows are found, position them
-            if current_count >= 4:
-                print("\n" + "=" * 60)
-                print("All 4 windows detected! Positioning...")
-                print()
-                
-                # Longer delay to ensure windows are fully initialized
-                time.sleep(2)
+            while True:
+                windows = dict(self.found_windows)
+                current_count = len(windows)
                 
-                success = self.position_all_windows(windows)
+                # Show progress when new windows are detected
+                if current_count != last_count:
+                    print(f"Found {current_count}/4 windows...")
+                    for window_type in windows.keys():
+                        title = win32gui.GetWindowText(windows[window_type])
+                        print(f"  - {window_type}: {title}")
+                    last_count = current_count
                 
-                print()
-                print("=" * 60)
-                if success == 4:
-                    print("✓ Successfully positioned all 4 windows!")
-                else:
-                    print(f"⚠ Positioned {success}/4 windows")
-                    print("  Tip: Try running option 2 to reposition existing windows")
-                
-                mode_text = "borderless" if self.borderless else "with title bars"
-                print(f"\nWindow arrangement (4 portrait displays 480x800, {mode_text}):")
-                print("  [Display 0] [Display 1] [Display 2] [Display 3]")
-                print("  [Window 1 ] [Window 2 ] [Window 3 ] [Window 4 ]")
-                print(f"\nCurrent order: {self.current_order}")
-                print("  (1=Server, 2=Client 1, 3=Client 2, 4=Client 3)")
-                print("\n💡 HTTP Server running on http://localhost:5000")
-                print("   Send POST to /reorder with JSON: {\"order\": [2,1,3,4]}")
+                remaining = deadline - time.time()
+                if self._ready.is_set() or remaining <= 0:
+                    break
                 
-                return True
+                # Sleep until a message (i.e. a WinEvent) arrives, then dispatch it
+                _user32.MsgWaitForMultipleObjects(0, None, False, int(remaining * 1000), QS_ALLINPUT)
+                win32gui.PumpWaitingMessages()
+        finally:
+            for hook in hooks:
+                if hook:
+                    _user32.UnhookWinEvent(hook)
+        
+        # When all 4 windows are found, position them
+        if self._ready.is_set():
+            print("\n" + "=" * 60)
+            print("All 4 windows detected! Positioning...")
+            print()
+            
+            # Longer delay to ensure windows are fully initialized
+            time.sleep(2)
             
-            # Wait before checking again
-            time.sleep(check_interval)
+            success = self.position_all_windows(windows)
+            
+            print()
+            print("=" * 60)
+            if success == 4:
+                print("✓ Successfully positioned all 4 windows!")
+            else:
+                print(f"⚠ Positioned {success}/4 windows")
+                print("  Tip: Try running option 2 to reposition existing windows")
+            
+            mode_text = "borderless" if self.borderless else "with title bars"
+            print(f"\nWindow arrangement (4 portrait displays 480x800, {mode_text}):")
+            print("  [Display 0] [Display 1] [Display 2] [Display 3]")
+            print("  [Window 1 ] [Window 2 ] [Window 3 ] [Window 4 ]")
+            print(f"\nCurrent order: {self.current_order}")
+            print("  (1=Server, 2=Client 1, 3=Client 2, 4=Client 3)")
+            print("\n💡 HTTP Server running on http://localhost:5000")
+            print("   Send POST to /reorder with JSON: {\"order\": [2,1,3,4]}")
+            
+            return True
         
         # Timeout reached
         print("\n" + "=" * 60)
@@ -344,6 +692,8 @@ class UnrealWindowManager:
             print(f"  - {window_type}: {title}")
         
         print("\nPositioning windows...")
+        # Force a real reposition even if the windows were placed before
+        self._last_rect.clear()
         success = self.position_all_windows(windows)
         
         if success > 0:
@@ -379,33 +729,37 @@ class UnrealWindowManager:
             return {"success": False, "message": "No windows found. Start the game first."}
         
         with self.lock:
-            self.current_order = new_order
+            plan = self._plan(new_order)
+            
+            # Blueprints often resend the current order, nothing to do then -
+            # unless a window was displaced since (e.g. by a resolution change),
+            # resending the order is how it gets put back. Checked under the
+            # lock so an apply still in progress can't be skipped
+            if (new_order == self.current_order and self._last_apply_ok
+                    and all(self._still_at(*move[:5]) for move in plan)):
+                return {"success": True, "message": "unchanged", "order": new_order}
             
-            print(f"\n{'='*60}")
-            print(f"Reordering windows: {new_order}")
-            print(f"{'='*60}")
+            self._last_apply_ok = False
+            self.current_order = new_order
             
-            success_count = 0
+            log.debug("Reordering windows: %s", new_order)
             
             # Apply new order
-            for pos_idx, window_idx in enumerate(new_order):
-                if window_idx in self.window_handles:
-                    hwnd = self.window_handles[window_idx]
-                    x, y, width, height = self.positions[pos_idx]
-                    window_key = self.window_keys[window_idx - 1]
-                    
-                    print(f"Position {pos_idx} ← Window {window_idx} ({window_key})")
-                    
-                    if self.position_window(hwnd, x, y, width, height):
-                        success_count += 1
-                        print(f"  ✓ Positioned")
-                    else:
-                        print(f"  ✗ Failed")
-                    
-                    # Small delay between windows
-                    time.sleep(0.15)
+            labels = {}
+            
+            for hwnd, x, y, width, height, window_key in plan:
+                log.debug("(%d, %d) ← %s", x, y, window_key)
+                labels[hwnd] = window_key
             
-            print(f"{'='*60}\n")
+            results = self._apply_moves(plan)
+            success_count = sum(results.values())
+            self._last_apply_ok = success_count == 4
+            
+            for hwnd, ok in results.items():
+                if ok:
+                    log.debug("%s positioned", labels[hwnd])
+                else:
+                    log.warning("%s failed", labels[hwnd])
             
             if success_count == 4:
                 return {
@@ -421,23 +775,27 @@ class UnrealWindowManager:
                 }
     
     def get_status(self) -> Dict:
-        """Get current window status."""
-        with self.lock:
-            return {
-                "windows_found": len(self.window_handles),
-                "current_order": self.current_order,
-                "window_mapping": {
-                    "1": "Server",
-                    "2": "Client 1",
-                    "3": "Client 2",
-                    "4": "Client 3"
-                }
+        """
+        Get current window status.
+        
+        Deliberately lock-free so /status never waits behind a positioning
+        operation; reading the rebound references is atomic under the GIL.
+        """
+        return {
+            "windows_found": len(self.window_handles),
+            "current_order": list(self.current_order),
+            "window_mapping": {
+                "1": "Server",
+                "2": "Client 1",
+                "3": "Client 2",
+                "4": "Client 3"
             }
+        }
 
 
 def create_http_server(manager: UnrealWindowManager, port: int = 5000):
     """
-    Create Flask HTTP server for remote control.
+    Create Flask HTTP server for remote control, served by waitress.
     
     Args:
         manager: UnrealWindowManager instance
@@ -490,10 +848,8 @@ def create_http_server(manager: UnrealWindowManager, port: int = 5000):
         """Health check endpoint."""
         return jsonify({"status": "ok"}), 200
     
-    # Suppress Flask development server warning
-    import logging
-    log = logging.getLogger('werkzeug')
-    log.setLevel(logging.ERROR)
+    # Suppress waitress queue depth warnings
+    logging.getLogger('waitress').setLevel(logging.ERROR)
     
     print(f"\n🌐 HTTP Server starting on http://localhost:{port}")
     print(f"   Endpoints:")
@@ -502,7 +858,8 @@ def create_http_server(manager: UnrealWindowManager, port: int = 5000):
     print(f"   - GET  /health   → Health check")
     print()
     
-    app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
+    # Window operations stay serialized by manager.lock
+    serve(app, host='0.0.0.0', port=port, threads=4, connection_limit=32)
 
 
 def main():